@@ -4,15 +4,94 @@ import threading
 import string
 import os
 import json
+import functools
+import concurrent.futures
 
-from topic import Topic
+from topic import Topic, write_atomic
 from question import Question
 from logic import load_questions_for_topic, configure_api
-import requests
 
-TOPICS_SOURCES_DIR = os.path.join(os.path.dirname(__file__), "topics_sources")
+TOPICS_SOURCES_DIR = Topic.SOURCES_DIR
 API_KEY_FILE = os.path.join(os.path.dirname(__file__), "API_key.json")
 
+# Fonts for the question screen
+_Q_FONT = ("Arial", 14)
+_OPT_FONT = ("Arial", 12)
+
+@functools.lru_cache(maxsize=None)
+def _sources_path(topic_name: str) -> str:
+    """
+    Returns the path of the sources JSON file for the given topic name.
+    """
+    return os.path.join(TOPICS_SOURCES_DIR, f"{topic_name.lower()}.json")
+
+
+# Shared HTTP session so API key tests reuse the pooled TLS connection, built by _get_http
+_HTTP = None
+
+
+def _get_http():
+    """
+    Returns the shared HTTP session, importing requests and creating it on first use.
+    """
+    global _HTTP
+    if _HTTP is None:
+        import requests
+        import requests.adapters
+
+        _HTTP = requests.Session()
+        _HTTP.mount("https://", requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=2))
+    return _HTTP
+
+# json.dump options for machine-written files; skips pretty-printing overhead
+_COMPACT_JSON = {"separators": (",", ":"), "ensure_ascii": False}
+
+# Parsed JSON files keyed by filepath, stored as (mtime_ns, data)
+_JSON_CACHE: dict[str, tuple[int, object]] = {}
+
+
+def _read_json(filepath: str):
+    """
+    Load a JSON file, reusing the cached parse if the file has not changed on disk.
+
+    The returned object is shared with the cache; copy it before mutating.
+
+    Args:
+        filepath (str): Path to the JSON file.
+
+    Returns:
+        The parsed JSON data.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    mtime = os.stat(filepath).st_mtime_ns
+    hit = _JSON_CACHE.get(filepath)
+    if hit and hit[0] == mtime:
+        return hit[1]
+    with open(filepath, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    _JSON_CACHE[filepath] = (mtime, data)
+    return data
+
+
+def _write_json(filepath: str, data, **dump_kwargs):
+    """
+    Write data to a JSON file and refresh its cache entry.
+    The file is replaced atomically, so concurrent readers never see a partial write.
+
+    Args:
+        filepath (str): Path to the JSON file.
+        data: JSON-serializable data to write.
+        **dump_kwargs: Extra keyword arguments passed to json.dumps.
+    """
+    try:
+        write_atomic(filepath, json.dumps(data, **dump_kwargs).encode("utf-8"))
+    except Exception:
+        _JSON_CACHE.pop(filepath, None)
+        raise
+    _JSON_CACHE[filepath] = (os.stat(filepath).st_mtime_ns, data)
+
 class QuizApp(tk.Tk):
     """
     A Tkinter-based GUI application for conducting AI quizzes with topic selection,
@@ -34,8 +113,9 @@ class QuizApp(tk.Tk):
         self.title("AI Quiz")
         self.geometry("1200x800")
 
-        # List of topics provided at initialization
+        # List of topics provided at initialization, indexed by name for lookups
         self.topics = topics
+        self._topic_index = {t.name: t for t in self.topics}
 
         # Initialize quiz state variables
         self.questions_list: list[Question] = []
@@ -43,6 +123,9 @@ class QuizApp(tk.Tk):
         self.score = 0
         self.current_question_index = 0
 
+        # Reusable question screen widgets, built on first question
+        self._question_widgets = None
+
         # Create the initial start screen UI
         self.create_start_screen()
 
@@ -55,6 +138,7 @@ class QuizApp(tk.Tk):
         # Clear any existing widgets before creating new ones
         for widget in self.winfo_children():
             widget.destroy()
+        self._question_widgets = None
 
         # Label for topic selection
         label = tk.Label(self, text="Select a Topic:", font=("Arial", 14))
@@ -64,7 +148,7 @@ class QuizApp(tk.Tk):
         self.topic_var = tk.StringVar()
         self.topic_combo = ttk.Combobox(
             self, textvariable=self.topic_var,
-            values=[t.name for t in self.topics],
+            values=list(self._topic_index),
             state="readonly"
         )
         if self.topics:
@@ -152,7 +236,10 @@ class QuizApp(tk.Tk):
             return
 
         # Find the selected topic object by name
-        self.current_topic = next((t for t in self.topics if t.name == topic_name), None)
+        self.current_topic = self._topic_index.get(topic_name)
+        if not self.current_topic:
+            self.status_label.config(text="Selected topic not found!")
+            return
 
         # Disable UI elements and show loading status
         self.status_label.config(text="Loading questions... Please wait.")
@@ -161,9 +248,9 @@ class QuizApp(tk.Tk):
         self.num_questions_entry.config(state="disabled")
 
         # Start a background thread to load questions (avoid freezing GUI)
-        threading.Thread(target=self.load_questions_thread, args=(topic_name, num_questions), daemon=True).start()
+        threading.Thread(target=self.load_questions_thread, args=(self.current_topic, num_questions), daemon=True).start()
 
-    def load_questions_thread(self, topic_name: str, num_questions: int):
+    def load_questions_thread(self, topic: Topic, num_questions: int):
         """
         Loads questions from the selected topic in a background thread.
         Uses reuse percentage and source priority options.
@@ -171,10 +258,6 @@ class QuizApp(tk.Tk):
         On failure, restores UI and shows error.
         """
         try:
-            topic = next((t for t in self.topics if t.name == topic_name), None)
-            if not topic:
-                raise Exception("Selected topic not found!")
-
             # Parse options from UI vars
             reuse_percent = int(self.reuse_percent_var.get())
             use_priorities = bool(self.use_priorities_var.get())
@@ -198,43 +281,77 @@ class QuizApp(tk.Tk):
         """
         Displays the current question with answer options as checkboxes.
         Enables 'Next' button only if user selects the correct number of answers.
+        The question screen widgets are built once and reused for every question.
         """
-        # Clear previous widgets
-        for widget in self.winfo_children():
-            widget.destroy()
-
         # If no more questions, show results screen
         if self.current_question_index >= len(self.questions_list):
             self.show_results()
             return
 
+        if self._question_widgets is None:
+            self._build_question_screen()
+
         question = self.questions_list[self.current_question_index]
 
         # Display question text
-        question_label = tk.Label(self, text=f"Question {self.current_question_index + 1}: {question.text}",
-                                  wraplength=580, font=("Arial", 14))
-        question_label.pack(pady=10)
+        self.question_label.config(text=f"Question {self.current_question_index + 1}: {question.text}")
 
         self.checked_vars = []
         self.num_correct = len(question.correct_answers)
-
-        # Create checkbox for each option, bind variable changes to check handler
-        for idx, option in enumerate(question.options):
-            letter = string.ascii_lowercase[idx]
-            var = tk.IntVar()
-            var.trace_add('write', self.on_check_changed)
-            cb = tk.Checkbutton(self, text=f"{letter}) {option}", variable=var, font=("Arial", 12))
+        self._selected_count = 0
+
+        # Add option checkboxes if this question has more options than any before
+        while len(self._question_widgets) < len(question.options):
+            self._add_option_checkbutton()
+
+        # Show one checkbox per option, in order, and hide the unused ones
+        for cb, _ in self._question_widgets:
+            cb.pack_forget()
+        for (cb, var), letter, option in zip(self._question_widgets, string.ascii_lowercase, question.options):
+            var.set(0)
+            cb.config(text=f"{letter}) {option}")
             cb.pack(anchor="w")
             self.checked_vars.append((letter, var))
 
         # Label showing how many options should be selected
-        select_label = tk.Label(self, text=f"Select: {self.num_correct}", font=("Arial", 10, "italic"))
-        select_label.pack(pady=5)
+        self.select_label.config(text=f"Select: {self.num_correct}")
+
+        self.next_button.config(state="disabled")  # disabled until correct number selected
+        self._next_enabled = False
+
+    def _build_question_screen(self):
+        """
+        Replaces the current screen with the question screen skeleton:
+        question label, option checkboxes, selection hint and Next button.
+        """
+        for widget in self.winfo_children():
+            widget.destroy()
+
+        self.question_label = tk.Label(self, wraplength=580, font=_Q_FONT)
+        self.question_label.pack(pady=10)
+
+        # Frame holding the option checkboxes, so they stay between label and button
+        self.options_frame = tk.Frame(self)
+        self.options_frame.pack(fill="x")
+        self._question_widgets = []
+        for _ in range(10):
+            self._add_option_checkbutton()
+
+        self.select_label = tk.Label(self, font=("Arial", 10, "italic"))
+        self.select_label.pack(pady=5)
 
         # Next button to submit current answer and proceed
         self.next_button = ttk.Button(self, text="Next", command=self.next_question)
         self.next_button.pack(pady=20)
-        self.next_button.config(state="disabled")  # disabled until correct number selected
+
+    def _add_option_checkbutton(self):
+        """
+        Creates one (unpacked) option checkbox with its variable, counting toggles via the check handler.
+        """
+        var = tk.IntVar()
+        cb = tk.Checkbutton(self.options_frame, variable=var, font=_OPT_FONT,
+                            command=lambda v=var: self._on_toggle(v))
+        self._question_widgets.append((cb, var))
 
     def next_question(self):
         """
@@ -257,126 +374,244 @@ class QuizApp(tk.Tk):
         """
         for widget in self.winfo_children():
             widget.destroy()
+        self._question_widgets = None
+
+        # Read save options on the main thread; Tk variables are not thread-safe
+        save_all = self.save_all_var.get() == 1
+        save_wrong = self.save_wrong_var.get() == 1
 
+        # Show total score label, filled in once results are computed
+        self.score_label = tk.Label(self, text="Computing results…", font=("Arial", 16))
+        self.score_label.pack(pady=10)
+
+        # Text widget for detailed results
+        self.result_box = tk.Text(self, wrap="word", width=70, height=15)
+        self.result_box.pack(padx=10, pady=10)
+        self.result_box.config(state="disabled")
+
+        # Button to restart quiz, returns user to start screen
+        restart_button = ttk.Button(self, text="Restart", command=self.create_start_screen)
+        restart_button.pack(pady=10)
+
+        # Score and format the results in a background thread
+        threading.Thread(
+            target=lambda: self.after(0, self._populate_results, *self._compute_results(save_all, save_wrong)),
+            daemon=True
+        ).start()
+
+    def _compute_results(self, save_all: bool, save_wrong: bool) -> tuple[int, str, list[Question]]:
+        """
+        Scores the quiz and builds the per-question summary text.
+        Safe to run off the main thread.
+
+        Args:
+            save_all (bool): Whether all questions should be saved.
+            save_wrong (bool): Whether only wrongly answered questions should be saved.
+
+        Returns:
+            tuple[int, str, list[Question]]: Score, summary text and questions to save.
+        """
         score = 0
-        result_text = "Quiz finished! Overview:\n\n"
+        parts = ["Quiz finished! Overview:\n\n"]
 
         questions_to_save = []
 
         # Iterate over questions and user answers, determine correctness
         for i, question in enumerate(self.questions_list):
             user = self.user_answers[i] if i < len(self.user_answers) else set()
-            correct = question.correct_answers
-            is_correct = user == correct
+            is_correct = user == question.correct_answers
 
             if is_correct:
                 score += 1
 
-            user_str = ", ".join(sorted(user)) if user else "No answer"
-            correct_str = ", ".join(sorted(correct))
-            result_text += f"Question {i + 1}: {question.text}\n"
-            result_text += f"Your answer(s): {user_str}\n"
-            result_text += f"Correct answer(s): {correct_str}\n"
-            result_text += f"{'✅ Correct' if is_correct else '❌ Incorrect'}\n\n"
+            # Answer letters come from string.ascii_lowercase, so scanning it yields them in order
+            user_str = ", ".join([c for c in string.ascii_lowercase if c in user]) if user else "No answer"
+            correct_str = question.correct_str
+            parts.append(f"Question {i + 1}: {question.text}\n")
+            parts.append(f"Your answer(s): {user_str}\n")
+            parts.append(f"Correct answer(s): {correct_str}\n")
+            parts.append(f"{'✅ Correct' if is_correct else '❌ Incorrect'}\n\n")
 
             # Decide which questions to save depending on user's save option
-            if self.save_all_var.get() == 1:
+            if save_all:
                 questions_to_save.append(question)
-            elif self.save_wrong_var.get() == 1 and not is_correct:
+            elif save_wrong and not is_correct:
                 questions_to_save.append(question)
 
-        # Show total score label
-        score_label = tk.Label(self, text=f"Your score: {score} of {len(self.questions_list)}", font=("Arial", 16))
-        score_label.pack(pady=10)
+        return score, "".join(parts), questions_to_save
 
-        # Text widget for detailed results
-        result_box = tk.Text(self, wrap="word", width=70, height=15)
-        result_box.pack(padx=10, pady=10)
-        result_box.insert("1.0", result_text)
-        result_box.config(state="disabled")
+    def _populate_results(self, score: int, result_text: str, questions_to_save: list[Question]):
+        """
+        Saves questions in a background thread, then fills the results screen
+        with the computed score and summary.
+        """
+        # Append questions to topic's old_questions and save if any to save,
+        # even if the results screen has already been left
+        if questions_to_save and hasattr(self, "current_topic"):
+            threading.Thread(target=self.current_topic.add_questions, args=(questions_to_save,), daemon=True).start()
 
-        # Button to restart quiz, returns user to start screen
-        restart_button = ttk.Button(self, text="Restart", command=self.create_start_screen)
-        restart_button.pack(pady=10)
+        # Results screen may have been left before computation finished
+        if not self.result_box.winfo_exists():
+            return
 
-        # Append questions to topic's old_questions and save if any to save
-        if questions_to_save and hasattr(self, "current_topic"):
-            self.current_topic.old_questions.extend(questions_to_save)
-            self.current_topic.save_questions()
+        self.score_label.config(text=f"Your score: {score} of {len(self.questions_list)}")
+
+        # Insert the summary in chunks so the event loop stays responsive
+        self.result_box.config(state="normal")
+        self._pending_chunks = [result_text[i:i + 4096] for i in range(0, len(result_text), 4096)]
+        self._pending_chunks.reverse()
+        self.after_idle(self._insert_next_chunk, self.result_box)
+
+    def _insert_next_chunk(self, result_box: tk.Text):
+        """
+        Inserts the next pending chunk of the results summary and reschedules
+        itself until all chunks are inserted, then makes the box read-only.
+        """
+        if not result_box.winfo_exists():
+            return
+        if self._pending_chunks:
+            result_box.insert("end", self._pending_chunks.pop())
+            self.after_idle(self._insert_next_chunk, result_box)
+        else:
+            result_box.config(state="disabled")
 
     def refresh_topics(self):
         """
-        Reloads the sources for all topics and updates the topic selection combobox.
+        Reloads the sources for all topics in a background thread
+        and then updates the topic selection combobox.
+        """
+        topics = list(self.topics)
+
+        def reload_sources():
+            # Topic source files are independent, so read them in parallel
+            if topics:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(topics))) as ex:
+                    list(ex.map(Topic.load_sources, topics))
+            self.after(0, self._apply_refreshed_topics)
+
+        threading.Thread(target=reload_sources, daemon=True).start()
+
+    def _apply_refreshed_topics(self):
+        """
+        Rebuilds the topic index and updates the topic selection combobox.
         """
-        for topic in self.topics:
-            topic.load_sources()
+        # Topics may have been added by the edit window
+        self._topic_index = {t.name: t for t in self.topics}
 
-        if hasattr(self, 'topic_combo'):
-            self.topic_combo['values'] = [t.name for t in self.topics]
+        if hasattr(self, 'topic_combo') and self.topic_combo.winfo_exists():
+            self.topic_combo['values'] = list(self._topic_index)
 
     def open_edit_topics(self):
         """
         Opens the EditTopicsWindow, allowing user to add topics or manage sources.
         """
-        EditTopicsWindow(self, self.topics, self.refresh_topics)
+        EditTopicsWindow.open(self, self.topics, self.refresh_topics)
 
-    def on_check_changed(self, *args):
+    def _on_toggle(self, var: tk.IntVar):
         """
-        Callback triggered when a checkbox changes state.
-        Enables the 'Next' button only if the number of selected checkboxes
-        matches the expected number of correct answers.
+        Callback triggered when a checkbox is toggled.
+        Keeps a running count of selected checkboxes and enables the 'Next' button
+        only if it matches the expected number of correct answers.
         """
-        selected_count = sum(var.get() for _, var in self.checked_vars)
-        if selected_count == self.num_correct:
-            self.next_button.config(state="normal")
-        else:
-            self.next_button.config(state="disabled")
+        self._selected_count += 1 if var.get() else -1
+        enabled = self._selected_count == self.num_correct
+        # Only touch the button when its state actually changes
+        if enabled != self._next_enabled:
+            self._next_enabled = enabled
+            self.next_button.config(state="normal" if enabled else "disabled")
 
 class EditTopicsWindow(tk.Toplevel):
     """
     A window to add new topics and manage existing sources for each topic.
     Allows adding, editing, and deleting sources per topic.
     """
-    _instance = None
 
-    def __new__(cls, *args, **kwargs):
-        if cls._instance is None or not cls._instance.winfo_exists():
-            cls._instance = super(EditTopicsWindow, cls).__new__(cls)
-        else:
-            cls._instance.lift()
-            cls._instance.focus_force()
-            return None
-        return cls._instance
+    @classmethod
+    def open(cls, master, topics, refresh_callback):
+        """
+        Opens the window, or raises and focuses it if it is already open for master.
+
+        Returns:
+            EditTopicsWindow: The open window.
+        """
+        inst = getattr(master, "_edit_window", None)
+        if inst and inst.winfo_exists():
+            inst.lift()
+            inst.focus_force()
+            return inst
+        inst = cls(master, topics, refresh_callback)
+        master._edit_window = inst
+        return inst
 
     def __init__(self, master, topics, refresh_callback):
-        if getattr(self, '_initialized', False):
-            return  # Avoid running __init__ multiple times
         super().__init__(master)
-        self._initialized = True
 
-        # Your existing __init__ code here
         self.title("Edit Topics")
         self.geometry("900x600")
 
         self.topics = topics
+        self._topic_index = {t.name: t for t in self.topics}
         self.refresh_callback = refresh_callback
 
+        # Single worker so source file reads and writes never race each other
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+        # Single worker for API key tests, with the in-flight test to reject duplicate clicks
+        self._api_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._api_test_future = None
+
         self.create_widgets()
 
+    def destroy(self):
+        """
+        Shuts down the background workers before destroying the window.
+        """
+        self._io_pool.shutdown(wait=False)
+        self._api_pool.shutdown(wait=False)
+        super().destroy()
+
     def create_widgets(self):
         """
         Creates UI elements, including a notebook with three tabs:
         - Add New Topic
         - Manage Sources
         - Manage API Key
-        """
-        notebook = ttk.Notebook(self)
-        notebook.pack(fill="both", expand=True)
 
-        # --- Tab 1: Add New Topic ---
-        frame_add_topic = ttk.Frame(notebook)
-        notebook.add(frame_add_topic, text="Add New Topic")
+        Each tab's contents are built the first time the tab is selected.
+        """
+        self.notebook = ttk.Notebook(self)
+        self.notebook.pack(fill="both", expand=True)
+
+        # Names of the tabs whose contents have been built
+        self._built = set()
+        self._tab_builders = {}
+
+        for text, builder in (
+            ("Add New Topic", self._build_add_topic_tab),
+            ("Manage Sources", self._build_manage_sources_tab),
+            ("Manage API Key", self._build_api_key_tab),
+        ):
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=text)
+            self._tab_builders[str(frame)] = builder
+
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        # Build the initially selected tab right away
+        self._on_tab_changed()
+
+    def _on_tab_changed(self, event=None):
+        """
+        Builds the selected tab's contents on its first selection.
+        """
+        tab = self.notebook.select()
+        if tab and tab not in self._built:
+            self._built.add(tab)
+            self._tab_builders[tab](self.nametowidget(tab))
 
+    def _build_add_topic_tab(self, frame_add_topic):
+        """
+        Builds the 'Add New Topic' tab.
+        """
         ttk.Label(frame_add_topic, text="New topic name:").pack(pady=5)
         self.new_topic_entry = ttk.Entry(frame_add_topic)
         self.new_topic_entry.pack(pady=5)
@@ -384,10 +619,10 @@ class EditTopicsWindow(tk.Toplevel):
         add_topic_btn = ttk.Button(frame_add_topic, text="Add Topic", command=self.add_topic)
         add_topic_btn.pack(pady=10)
 
-        # --- Tab 2: Manage Sources ---
-        frame_manage_sources = ttk.Frame(notebook)
-        notebook.add(frame_manage_sources, text="Manage Sources")
-
+    def _build_manage_sources_tab(self, frame_manage_sources):
+        """
+        Builds the 'Manage Sources' tab and loads the sources of the first topic.
+        """
         ttk.Label(frame_manage_sources, text="Select topic:").pack(pady=5)
         self.topic_combo = ttk.Combobox(frame_manage_sources, state="readonly")
         self.topic_combo.pack(pady=5)
@@ -405,13 +640,17 @@ class EditTopicsWindow(tk.Toplevel):
         self.add_source_btn = ttk.Button(btn_frame, text="Add New Source", command=self.add_source)
         self.add_source_btn.grid(row=0, column=2, padx=5)
 
+        # Label for background save status
+        self.sources_status_label = ttk.Label(frame_manage_sources, text="")
+        self.sources_status_label.pack(pady=5)
+
         # Initialize topic list
         self.update_topic_list()
 
-        # --- Tab 3: Manage API Key ---
-        frame_manage_api = ttk.Frame(notebook)
-        notebook.add(frame_manage_api, text="Manage API Key")
-
+    def _build_api_key_tab(self, frame_manage_api):
+        """
+        Builds the 'Manage API Key' tab and loads the current API key.
+        """
         ttk.Label(frame_manage_api, text="Current API Key (readonly):").pack(pady=(10, 2))
         self.old_api_key_var = tk.StringVar()
         # Use Label instead of Entry for non-selectable display
@@ -444,15 +683,15 @@ class EditTopicsWindow(tk.Toplevel):
         Raises:
             Displays a messagebox with an error if loading or parsing the API key fails.
         """
-        if os.path.exists(API_KEY_FILE):
-            try:
-                with open(API_KEY_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    old_key = data.get("api_key", "")
-                    self.old_api_key_var.set(old_key)      # readonly display
-                    self.new_api_key_var.set("")            # clear new input
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load API key: {e}")
+        try:
+            data = _read_json(API_KEY_FILE)
+            old_key = data.get("api_key", "")
+            self.old_api_key_var.set(old_key)      # readonly display
+            self.new_api_key_var.set("")            # clear new input
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load API key: {e}")
 
     def test_api_key(self, key: str) -> bool:
         """
@@ -474,8 +713,11 @@ class EditTopicsWindow(tk.Toplevel):
             "temperature": 0
         }
 
+        # Imported here to keep requests off the startup path
+        import requests
+
         try:
-            response = requests.post(test_api_url, headers=headers, json=data, timeout=5)
+            response = _get_http().post(test_api_url, headers=headers, json=data, timeout=5)
             if response.status_code == 200:
                 # Optionally check if response content looks valid
                 resp_json = response.json()
@@ -491,11 +733,16 @@ class EditTopicsWindow(tk.Toplevel):
 
         - Validates that the new API key is not empty.
         - Disables the input field and shows a status message while testing the key.
-        - Tests the API key in a background thread using test_api_key().
+        - Ignores the click if a previous test is still running.
+        - Tests the API key in a background worker using test_api_key().
         - If valid, saves the key to API_KEY_FILE and updates the display.
         - If invalid, shows an error and clears the input.
         - All UI updates are performed on the main thread.
         """
+        # Ignore clicks while a previous test is still running
+        if self._api_test_future and not self._api_test_future.done():
+            return
+
         new_key = self.new_api_key_var.get().strip()
         if not new_key:
             messagebox.showwarning("Validation", "API key cannot be empty.")
@@ -505,48 +752,52 @@ class EditTopicsWindow(tk.Toplevel):
         self.new_api_key_entry.config(state="disabled")
         self.api_status_label.config(text="Testing API key...", foreground="blue")
 
-        def test_and_save():
-            # Test the API key (network call, may take time)
-            valid = self.test_api_key(new_key)
-
-            def on_complete():
-                # Re-enable input field
-                self.new_api_key_entry.config(state="normal")
-                if valid:
-                    try:
-                        # Save the valid API key to file
-                        with open(API_KEY_FILE, "w", encoding="utf-8") as f:
-                            json.dump({"api_key": new_key}, f, indent=2)
-                        # Update the readonly display and clear input
-                        self.old_api_key_var.set(new_key)
-                        self.new_api_key_var.set("")
-                        self.api_status_label.config(text="API key saved successfully.", foreground="green")
-                    except Exception as e:
-                        # Show error if saving fails
-                        messagebox.showerror("Error", f"Failed to save API key: {e}")
-                        self.api_status_label.config(text="Failed to save API key.", foreground="red")
-                else:
-                    # Clear input and show invalid key message
-                    self.new_api_key_var.set("")
-                    self.api_status_label.config(text="Invalid API key. Please try again.", foreground="red")
-
-            # Schedule UI updates on the main thread
-            self.after(0, on_complete)
-
-        # Run the test and save logic in a background thread
-        threading.Thread(target=test_and_save, daemon=True).start()
-
-
+        # Test the API key in the background (network call, may take time)
+        self._api_test_future = self._api_pool.submit(self.test_api_key, new_key)
+        self._api_test_future.add_done_callback(lambda f: self.after(0, self._on_api_test_done, new_key, f))
 
+    def _on_api_test_done(self, new_key: str, fut: concurrent.futures.Future):
+        """
+        Handles the result of a background API key test on the main thread.
+        Saves the key if it is valid, otherwise clears the input.
+        """
+        if not self.winfo_exists():
+            return
 
+        # Re-enable input field
+        self.new_api_key_entry.config(state="normal")
+        try:
+            valid = fut.result()
+        except Exception:
+            valid = False
 
+        if valid:
+            try:
+                # Save the valid API key to file
+                _write_json(API_KEY_FILE, {"api_key": new_key}, indent=2)
+                # Update the readonly display and clear input
+                self.old_api_key_var.set(new_key)
+                self.new_api_key_var.set("")
+                self.api_status_label.config(text="API key saved successfully.", foreground="green")
+            except Exception as e:
+                # Show error if saving fails
+                messagebox.showerror("Error", f"Failed to save API key: {e}")
+                self.api_status_label.config(text="Failed to save API key.", foreground="red")
+        else:
+            # Clear input and show invalid key message
+            self.new_api_key_var.set("")
+            self.api_status_label.config(text="Invalid API key. Please try again.", foreground="red")
 
     def update_topic_list(self):
         """
         Refreshes the topic selection combobox with current topics
         and loads sources for the first topic.
         """
-        self.topic_combo['values'] = [t.name for t in self.topics]
+        # Nothing to refresh until the Manage Sources tab has been built
+        if not hasattr(self, "topic_combo"):
+            return
+
+        self.topic_combo['values'] = list(self._topic_index)
         if self.topics:
             self.topic_combo.current(0)
             self.load_sources()
@@ -561,42 +812,97 @@ class EditTopicsWindow(tk.Toplevel):
             messagebox.showwarning("Input error", "Topic name cannot be empty")
             return
 
-        filepath = os.path.join(TOPICS_SOURCES_DIR, f"{name.lower()}.json")
+        filepath = _sources_path(name)
         if os.path.exists(filepath):
             messagebox.showwarning("Duplicate", "Topic already exists")
             return
 
         os.makedirs(TOPICS_SOURCES_DIR, exist_ok=True)
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump([], f)
+        _write_json(filepath, [])
 
         new_topic = Topic(name)
         self.topics.append(new_topic)
+        self._topic_index[new_topic.name] = new_topic
         self.update_topic_list()
         self.refresh_callback()
         self.new_topic_entry.delete(0, tk.END)
 
     def load_sources(self, event=None):
         """
-        Loads and displays the sources for the selected topic.
+        Loads the sources for the selected topic in the background I/O worker
+        and displays them once read.
         Clears listbox if no file or no sources.
         """
         topic_name = self.topic_combo.get()
         if not topic_name:
             return
 
-        filepath = os.path.join(TOPICS_SOURCES_DIR, f"{topic_name.lower()}.json")
-        if not os.path.isfile(filepath):
-            self.sources_listbox.delete(0, tk.END)
-            return
+        def read_sources():
+            try:
+                return _read_json(_sources_path(topic_name))
+            except FileNotFoundError:
+                return []
+
+        fut = self._io_pool.submit(read_sources)
+        fut.add_done_callback(lambda f: self.after(0, self._populate_listbox, topic_name, f))
 
-        with open(filepath, "r", encoding="utf-8") as f:
-            sources = json.load(f)
+    def _populate_listbox(self, topic_name: str, fut: concurrent.futures.Future):
+        """
+        Fills the sources listbox with the result of a background read.
+        Ignores the result if another topic was selected in the meantime.
+        """
+        if not self.winfo_exists() or topic_name != self.topic_combo.get():
+            return
+        try:
+            sources = fut.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load sources: {e}")
+            return
 
+        # Insert all names in a single Tcl call
+        names = [src.get("name") or "Unnamed Source" for src in sources]
         self.sources_listbox.delete(0, tk.END)
-        for src in sources:
-            name = src.get("name") or "Unnamed Source"
-            self.sources_listbox.insert(tk.END, name)
+        if names:
+            self.sources_listbox.insert(tk.END, *names)
+
+    def _queue_sources_write(self, topic_name: str, mutate):
+        """
+        Applies mutate to a copy of the topic's sources and writes the result
+        in the background I/O worker, then reloads the listbox and topics.
+
+        Args:
+            topic_name (str): Topic whose sources file is modified.
+            mutate (Callable[[list], None]): Function modifying the sources list in place.
+        """
+        def read_modify_write():
+            filepath = _sources_path(topic_name)
+            try:
+                sources = list(_read_json(filepath))
+            except FileNotFoundError:
+                sources = []
+            mutate(sources)
+            _write_json(filepath, sources, **_COMPACT_JSON)
+
+        self.sources_status_label.config(text="Saving…", foreground="blue")
+        fut = self._io_pool.submit(read_modify_write)
+        fut.add_done_callback(lambda f: self.after(0, self._on_sources_saved, f))
+
+    def _on_sources_saved(self, fut: concurrent.futures.Future):
+        """
+        Reports the outcome of a background sources write and refreshes the views.
+        """
+        if not self.winfo_exists():
+            return
+        try:
+            fut.result()
+        except Exception as e:
+            self.sources_status_label.config(text="Failed to save sources.", foreground="red")
+            messagebox.showerror("Error", f"Failed to save sources: {e}")
+            return
+
+        self.sources_status_label.config(text="")
+        self.load_sources()
+        self.refresh_callback()
 
     def edit_source(self):
         """
@@ -609,11 +915,22 @@ class EditTopicsWindow(tk.Toplevel):
         idx = selection[0]
         topic_name = self.topic_combo.get()
 
-        filepath = os.path.join(TOPICS_SOURCES_DIR, f"{topic_name.lower()}.json")
-        with open(filepath, "r", encoding="utf-8") as f:
-            sources = json.load(f)
+        # Read through the I/O worker so the read is ordered after any pending write
+        fut = self._io_pool.submit(_read_json, _sources_path(topic_name))
+        fut.add_done_callback(lambda f: self.after(0, self._open_edit_dialog, topic_name, idx, f))
 
-        source_data = sources[idx]
+    def _open_edit_dialog(self, topic_name: str, idx: int, fut: concurrent.futures.Future):
+        """
+        Opens AddSourceDialog for the source at idx once its topic's sources have been read.
+        Does nothing if another topic was selected in the meantime.
+        """
+        if not self.winfo_exists() or topic_name != self.topic_combo.get():
+            return
+        try:
+            source_data = fut.result()[idx]
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load source: {e}")
+            return
 
         # Open AddSourceDialog in edit mode with existing source data
         AddSourceDialog(self, lambda updated: self.save_edited_source(idx, updated), existing_data=source_data)
@@ -623,17 +940,11 @@ class EditTopicsWindow(tk.Toplevel):
         Saves changes made to an edited source back to the topic's JSON file.
         """
         topic_name = self.topic_combo.get()
-        filepath = os.path.join(TOPICS_SOURCES_DIR, f"{topic_name.lower()}.json")
-        with open(filepath, "r", encoding="utf-8") as f:
-            sources = json.load(f)
-
-        sources[idx] = updated_source
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(sources, f, indent=2)
+        def replace(sources):
+            sources[idx] = updated_source
 
-        self.load_sources()
-        self.refresh_callback()
+        self._queue_sources_write(topic_name, replace)
 
     def delete_source(self):
         """
@@ -650,19 +961,13 @@ class EditTopicsWindow(tk.Toplevel):
         if not messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this source?"):
             return
 
-        filepath = os.path.join(TOPICS_SOURCES_DIR, f"{topic_name.lower()}.json")
-        with open(filepath, "r", encoding="utf-8") as f:
-            sources = json.load(f)
-
-        sources.pop(idx)
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(sources, f, indent=2)
-
-        self.load_sources()
-        self.refresh_callback()
+        self._queue_sources_write(topic_name, lambda sources: sources.pop(idx))
 
     def add_source(self):
+        """
+        Opens a dialog to add a new source to the selected topic.
+        The add button stays disabled while the dialog is open.
+        """
         topic_name = self.topic_combo.get()
         if not topic_name:
             messagebox.showwarning("Select topic", "Please select a topic first")
@@ -672,31 +977,21 @@ class EditTopicsWindow(tk.Toplevel):
         self.add_source_btn.config(state="disabled")
 
         # Define a callback to re-enable the button when dialog closes
-        def on_dialog_close():
-            self.add_source_btn.config(state="normal")
+        def on_dialog_close(event):
+            # <Destroy> also fires for the dialog's children
+            if event.widget is dialog and self.winfo_exists():
+                self.add_source_btn.config(state="normal")
 
-        # Pass on_dialog_close to AddSourceDialog, assuming it accepts a close callback
         dialog = AddSourceDialog(self, lambda src: self.save_new_source(topic_name, src))
-        # Bind to the dialog's destroy event to re-enable button when dialog closes
-        dialog.protocol("WM_DELETE_WINDOW", lambda: (on_dialog_close(), dialog.destroy()))
+        # Re-enable the button however the dialog is closed (Save, Cancel or window close)
+        dialog.bind("<Destroy>", on_dialog_close)
 
+    def save_new_source(self, topic_name, source_data):
         """
-        Saves a new source to the selected topic's JSON file,
+        Saves a new source to the given topic's JSON file,
         then reloads sources and updates the topics.
         """
-        filepath = os.path.join(TOPICS_SOURCES_DIR, f"{topic_name.lower()}.json")
-        sources = []
-        if os.path.isfile(filepath):
-            with open(filepath, "r", encoding="utf-8") as f:
-                sources = json.load(f)
-
-        sources.append(source_data)
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(sources, f, indent=2)
-
-        messagebox.showinfo("Success", "Source added")
-        self.load_sources()
-        self.refresh_callback()
+        self._queue_sources_write(topic_name, lambda sources: sources.append(source_data))
 
 class AddSourceDialog(tk.Toplevel):
     """
@@ -748,14 +1043,13 @@ class AddSourceDialog(tk.Toplevel):
                 importance_frame,
                 text="",  # No label text to save space
                 value=i,
-                variable=self.importance_var,
-                command=self.update_importance_label  # Update label on change
+                variable=self.importance_var
             )
             # Pack horizontally with spacing to avoid overlap
             rb.pack(side="left", padx=8)
 
-        # Label below the radio buttons showing currently selected importance
-        self.importance_value_label = ttk.Label(self, text=str(self.importance_var.get()), font=("Arial", 12, "bold"))
+        # Label below the radio buttons showing currently selected importance, kept in sync by Tk
+        self.importance_value_label = ttk.Label(self, textvariable=self.importance_var, font=("Arial", 12, "bold"))
         self.importance_value_label.pack(pady=5)
 
         # Label and text box for optional comments about the source
@@ -775,16 +1069,8 @@ class AddSourceDialog(tk.Toplevel):
             self.link_entry.insert(0, existing_data.get("link", ""))
             self.name_entry.insert(0, existing_data.get("name", ""))
             self.importance_var.set(existing_data.get("importance", 5))
-            self.update_importance_label()
             self.comment_text.insert("1.0", existing_data.get("comment", ""))
 
-    def update_importance_label(self):
-        """
-        Updates the label that displays the currently selected importance value.
-        Called whenever a radio button is selected.
-        """
-        self.importance_value_label.config(text=str(self.importance_var.get()))
-
     def on_save(self):
         """
         Called when the user clicks the Save button.
@@ -832,8 +1118,11 @@ class ManageSourcesTab(ttk.Frame):
         super().__init__(master)
         self.topic = topic
 
-        # Listbox to display sources by name
-        self.source_listbox = tk.Listbox(self, height=12, width=40)
+        # Listbox to display sources by name. exportselection=False keeps its selection
+        # from being claimed as the X selection (and cleared by other widgets);
+        # highlightthickness=0 drops the focus highlight border.
+        self.source_listbox = tk.Listbox(self, height=12, width=40, exportselection=False,
+                                         highlightthickness=0)
         self.source_listbox.pack(pady=10, padx=10, side="left", fill="y")
 
         # Scrollbar linked to the listbox for vertical scrolling
@@ -858,10 +1147,34 @@ class ManageSourcesTab(ttk.Frame):
     def refresh_sources(self):
         """
         Refreshes the listbox to display the current list of sources.
+        Used for the initial populate; single edits update only their row.
+        """
+        if self.source_listbox.size():
+            self.source_listbox.delete(0, tk.END)
+        # Insert all names in a single Tcl call, bypassing the Listbox.insert wrapper
+        if self.topic.sources:
+            self.source_listbox.tk.call(str(self.source_listbox), "insert", "end",
+                                        *[src["name"] for src in self.topic.sources])
+
+    def _insert_row(self, idx, name):
+        """
+        Inserts a single source name into the listbox at idx.
         """
-        self.source_listbox.delete(0, tk.END)
-        for src in self.topic.sources:
-            self.source_listbox.insert(tk.END, src["name"])
+        self.source_listbox.insert(idx, name)
+
+    def _replace_row(self, idx, name):
+        """
+        Replaces the source name shown at idx, keeping it selected.
+        """
+        self.source_listbox.delete(idx)
+        self.source_listbox.insert(idx, name)
+        self.source_listbox.selection_set(idx)
+
+    def _delete_row(self, idx):
+        """
+        Removes the source name shown at idx from the listbox.
+        """
+        self.source_listbox.delete(idx)
 
     def get_selected_index(self):
         """
@@ -911,7 +1224,7 @@ class ManageSourcesTab(ttk.Frame):
         if messagebox.askyesno("Delete source", "Are you sure?"):
             self.topic.sources.pop(idx)
             self.topic.save_sources()
-            self.refresh_sources()
+            self._delete_row(idx)
 
     def save_new_source(self, source_data):
         """
@@ -922,7 +1235,7 @@ class ManageSourcesTab(ttk.Frame):
         """
         self.topic.sources.append(source_data)
         self.topic.save_sources()
-        self.refresh_sources()
+        self._insert_row(tk.END, source_data["name"])
 
     def update_source(self, idx, updated_data):
         """
@@ -934,7 +1247,7 @@ class ManageSourcesTab(ttk.Frame):
         """
         self.topic.sources[idx] = updated_data
         self.topic.save_sources()
-        self.refresh_sources()
+        self._replace_row(idx, updated_data["name"])
 
 class ManageAPIKeyTab(ttk.Frame):
     """
@@ -974,11 +1287,11 @@ class ManageAPIKeyTab(ttk.Frame):
         Loads the API key from the API_KEY_FILE if it exists,
         and sets it in the entry widget.
         """
-        if os.path.exists(API_KEY_FILE):
-            try:
-                with open(API_KEY_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.api_key_var.set(data.get("api_key", ""))
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load API key: {e}")
+        try:
+            data = _read_json(API_KEY_FILE)
+            self.api_key_var.set(data.get("api_key", ""))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load API key: {e}")
 
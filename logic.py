@@ -1,15 +1,59 @@
-import requests
 from question import Question, parse_question
-from topic import Topic, Source
-import re
+from topic import Topic, Source, json_loads, write_atomic
 import os
 import json
 import random
+import hashlib
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 API_KEY = None
 MODEL = "llama3-70b-8192"
 API_URL = "https://api.groq.com/openai/v1/chat/completions"
-TOPICS_SOURCES_DIR = "AIQUIZ/topics_sources"
+# Same directory Topic reads and writes sources in, so every reader and writer uses the same file
+TOPICS_SOURCES_DIR = Topic.SOURCES_DIR
+
+# On-disk cache of AI responses keyed by model and prompt, for repeated runs during development.
+# Off by default, since identical prompts would otherwise always yield the same question.
+CACHE_RESPONSES = os.environ.get("AIQUIZ_CACHE_RESPONSES") == "1"
+_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".aiquiz_cache")
+_CACHE_MAX_ENTRIES = 256
+# Serializes pruning, which runs from the question generation worker threads
+_CACHE_PRUNE_LOCK = threading.Lock()
+
+# Request headers for the AI API, rebuilt only when the API key changes
+_HEADERS = {
+    "Authorization": f"Bearer {API_KEY}",
+    "Content-Type": "application/json"
+}
+
+# Shared HTTP session so API calls reuse keep-alive connections, built by _get_session
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session():
+    """
+    Returns the shared HTTP session, importing requests and creating it on first use.
+    Transient API errors are retried with backoff.
+    """
+    global _SESSION
+    if _SESSION is None:
+        # Question generation workers may get here at the same time; build only one session
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                              allowed_methods=frozenset({"POST"}), raise_on_status=False)
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+                _SESSION = session
+    return _SESSION
 
 def configure_api(api_key: str, model: str = None):
     """
@@ -21,12 +65,14 @@ def configure_api(api_key: str, model: str = None):
     """
     global API_KEY, MODEL
     API_KEY = api_key
+    _HEADERS["Authorization"] = f"Bearer {API_KEY}"
     if model:
         MODEL = model
 
 def call_ai_api(topic_instance: Topic, prompt_text: str) -> str:
     """
     Call the AI API to generate a multiple-choice question.
+    If CACHE_RESPONSES is enabled, repeated prompts are answered from the response cache.
 
     Args:
         topic_instance (Topic): The topic for which to generate the question.
@@ -38,12 +84,73 @@ def call_ai_api(topic_instance: Topic, prompt_text: str) -> str:
     Raises:
         Exception: If the API request fails.
     """
-    headers = {
-        "Authorization": f"Bearer {API_KEY}",
-        "Content-Type": "application/json"
-    }
+    if CACHE_RESPONSES:
+        return _cached_completion(MODEL, prompt_text)
+    return _request_completion(MODEL, prompt_text)
+
+@functools.lru_cache(maxsize=_CACHE_MAX_ENTRIES)
+def _cached_completion(model: str, prompt_text: str) -> str:
+    """
+    Return the AI response for a prompt from the on-disk cache,
+    requesting and storing it on a miss. Results are also memoized in memory.
+    """
+    key = hashlib.sha256(f"{model}\n{prompt_text}".encode("utf-8")).hexdigest()
+    path = os.path.join(_CACHE_DIR, f"{key}.json")
+    try:
+        with open(path, "rb") as f:
+            content = json_loads(f.read())["content"]
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        pass
+    else:
+        # Mark the entry as recently used so pruning keeps it
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return content
+
+    content = _request_completion(model, prompt_text)
+
+    # Write atomically so concurrent generations never read a partial entry
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+    write_atomic(path, json.dumps({"content": content}).encode("utf-8"))
+    _prune_response_cache()
+
+    return content
+
+def _prune_response_cache():
+    """
+    Delete the least recently used cached responses beyond _CACHE_MAX_ENTRIES.
+    """
+    with _CACHE_PRUNE_LOCK:
+        entries = []
+        with os.scandir(_CACHE_DIR) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                # Entries may vanish while scanning
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except FileNotFoundError:
+                    pass
+        if len(entries) <= _CACHE_MAX_ENTRIES:
+            return
+        entries.sort()
+        for _, path in entries[:len(entries) - _CACHE_MAX_ENTRIES]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+def _request_completion(model: str, prompt_text: str) -> str:
+    """
+    Send a prompt to the AI API and return the response text.
+
+    Raises:
+        Exception: If the API request fails.
+    """
     data = {
-        "model": MODEL,
+        "model": model,
         "messages": [
             {"role": "system", "content": (
                 "You are a multiple-choice question generator. "
@@ -63,11 +170,11 @@ def call_ai_api(topic_instance: Topic, prompt_text: str) -> str:
         "temperature": 0.7
     }
 
-    response = requests.post(API_URL, headers=headers, json=data)
+    response = _get_session().post(API_URL, headers=_HEADERS, json=data)
     if response.status_code != 200:
         raise Exception(f"API request error: {response.status_code} {response.text}")
 
-    return response.json()["choices"][0]["message"]["content"]
+    return json_loads(response.content)["choices"][0]["message"]["content"]
 
 def build_prompt(topic: Topic, source: Source) -> str:
     """
@@ -105,54 +212,65 @@ def load_questions_for_topic(topic: Topic, num_questions: int, reuse_percent: in
     Args:
         topic (Topic): The topic for which to load questions.
         num_questions (int): Number of questions to load.
-        reuse_percent (int): Percentage chance to reuse an old question.
+        reuse_percent (int): Percentage of questions to take from old questions.
         use_priorities (bool): Whether to use source priorities when selecting sources.
 
     Returns:
         list[Question]: List of loaded Question objects.
     """
-    questions = []
+    # Reuse pool is the topic's in-memory questions, which may hold saves not yet written to disk
+    old_questions = topic.old_questions[:num_questions]
+
+    # Pick which slots reuse an old question, as close to reuse_percent as the old questions allow
+    k_reuse = max(0, min(len(old_questions), num_questions, round(num_questions * reuse_percent / 100)))
+    reuse_slots = set(random.sample(range(num_questions), k_reuse))
+
+    # Fill the reused slots (None means generate a new one).
+    # head is the index of the next unused old question; consumed ones are removed once after the loop
+    head = 0
+    slots: list[Optional[Question]] = []
+    for i in range(num_questions):
+        if i in reuse_slots:
+            # Take the next old question
+            slots.append(old_questions[head])
+            head += 1
+        else:
+            slots.append(None)
 
-    # Load old questions from JSON if file exists
-    old_questions_file = topic.file_path
-    if os.path.exists(old_questions_file):
+    # Generate the new questions concurrently, since the API calls are I/O bound
+    new_slots = [i for i, question in enumerate(slots) if question is None]
+    new_questions = []
+    if new_slots:
+        executor = ThreadPoolExecutor(max_workers=min(8, len(new_slots)))
         try:
-            with open(old_questions_file, "r", encoding="utf-8") as f:
-                old_questions_data = json.load(f)
-        except json.JSONDecodeError:
-            old_questions_data = []
-    else:
-        old_questions_data = []
+            jobs = []
+            for i in new_slots:
+                source = topic.get_random_source(use_priorities)
+                prompt = build_prompt(topic, source)
+                jobs.append((i, source, executor.submit(call_ai_api, topic, prompt)))
 
-    for _ in range(num_questions):
-        # Decide whether to use an old question
-        use_old = (random.randint(1, 100) <= reuse_percent) and bool(old_questions_data)
+            for i, source, future in jobs:
+                ai_output = future.result()
 
-        if use_old:
-            # Take the first old question and remove it from the list
-            old_q_dict = old_questions_data.pop(0)
-            question = Question.from_dict(old_q_dict)
-            questions.append(question)
+                # Parse AI output into a Question object
+                question = parse_question(ai_output, source.link)
 
-            # Save updated old questions list back to file
-            with open(old_questions_file, "w", encoding="utf-8") as f:
-                json.dump(old_questions_data, f, indent=2)
+                # Clean text for display
+                display_text = clean_ai_text(ai_output)
+                question.text = display_text
 
-        else:
-            # Generate a new question using the AI API
-            source = topic.get_random_source(use_priorities)
-            prompt = build_prompt(topic, source)
-            ai_output = call_ai_api(topic, prompt)
-
-            # Parse AI output into a Question object
-            question = parse_question(ai_output, source.link)
+                slots[i] = question
+                new_questions.append(question)
+        finally:
+            # On error, cancel queued API calls and report it without waiting for running ones
+            executor.shutdown(wait=False, cancel_futures=True)
 
-            # Clean text for display
-            display_text = clean_ai_text(ai_output)
-            question.text = display_text
+    questions = slots
 
-            questions.append(question)
-            topic.add_question(question)
+    # Save updated old questions list back to file in a single write,
+    # without the reused ones and with the newly generated ones
+    if head or new_questions:
+        topic.replace_questions(old_questions[:head], new_questions)
 
     return questions
 
@@ -169,15 +287,14 @@ def clean_ai_text(ai_text: str) -> str:
         str: The cleaned text for display, starting right after 'Question:'.
     """
     # Extract everything after 'Question:' (excluding 'Question:' itself)
-    match = re.search(r"Question:\s*(.*)", ai_text, flags=re.DOTALL)
-    if match:
-        ai_text = match.group(1)
-    else:
-        # If no 'Question:' found, just keep original text
-        ai_text = ai_text
+    _, sep, tail = ai_text.partition("Question:")
+    if sep:
+        ai_text = tail.lstrip()
+    # If no 'Question:' found, just keep original text
 
     # Remove 'Correct answers:' and everything after it
-    cleaned_text = re.sub(r"\nCorrect answers:.*", "", ai_text, flags=re.DOTALL).strip()
+    head, sep, _ = ai_text.partition("\nCorrect answers:")
+    cleaned_text = (head if sep else ai_text).strip()
 
     return cleaned_text
 
@@ -206,12 +323,12 @@ def load_topics_from_disk():
         list[Topic]: List of Topic objects, one for each topic file found.
     """
     topics = []
-    if not os.path.exists(TOPICS_SOURCES_DIR):
-        os.makedirs(TOPICS_SOURCES_DIR)
-
-    for filename in os.listdir(TOPICS_SOURCES_DIR):
-        if filename.endswith(".json"):
-            topic_name = os.path.splitext(filename)[0].capitalize()
-            topic = Topic(topic_name)  # only name, not sources
-            topics.append(topic)
+    os.makedirs(TOPICS_SOURCES_DIR, exist_ok=True)
+
+    with os.scandir(TOPICS_SOURCES_DIR) as it:
+        for entry in it:
+            if entry.name.endswith(".json") and entry.is_file():
+                topic_name = entry.name[:-len(".json")].capitalize()
+                topic = Topic(topic_name, sources_file=entry.path)  # sources load lazily
+                topics.append(topic)
     return topics
\ No newline at end of file
@@ -1,26 +1,42 @@
 import re
 import string
 
-from typing import List, Set
+from typing import FrozenSet, Iterable, Tuple
+
+# Patterns used to parse AI output in parse_question
+_QUESTION_RE = re.compile(r"Question:\s*(.+)", re.DOTALL)
+_OPTION_RE = re.compile(r"\d\)\s*(.+)")
+_CORRECT_RE = re.compile(r"(Correct answers|Answer keys|At the end):?\s*([\d\s]+)")
 
 class Question:
     """
     Represents a multiple-choice question with options, correct answers, and an optional source.
+
+    Attributes:
+        text (str): The question text.
+        options (Tuple[str, ...]): Answer options.
+        correct_answers (FrozenSet[str]): Correct answer letters.
+        correct_str (str): Sorted, comma-separated correct answer letters for display.
+        source (str): Source URL or reference.
     """
-    def __init__(self, text: str, options: List[str], correct_answers: Set[str], source: str = ""):
+    # Many stored questions are loaded at once, so skip the per-instance __dict__
+    __slots__ = ("text", "options", "correct_answers", "correct_str", "source")
+
+    def __init__(self, text: str, options: Iterable[str], correct_answers: Iterable[str], source: str = ""):
         """
         Initialize a Question object.
 
         Args:
             text (str): The question text.
-            options (List[str]): List of answer options.
-            correct_answers (Set[str]): Set of correct answer letters (e.g., {'a', 'c'}).
+            options (Iterable[str]): Answer options, stored as a tuple.
+            correct_answers (Iterable[str]): Correct answer letters (e.g., {'a', 'c'}).
             source (str, optional): Source URL or reference. Defaults to "".
         """
         self.text = text
-        self.options = options
-        self.correct_answers = correct_answers
-        self.source = source  
+        self.options: Tuple[str, ...] = tuple(options)
+        self.correct_answers: FrozenSet[str] = frozenset(correct_answers)
+        self.correct_str = ", ".join(sorted(self.correct_answers))
+        self.source = source
 
     def to_dict(self):
         """
@@ -31,8 +47,8 @@ class Question:
         """
         return {
             "text": self.text,
-            "options": self.options,
-            "correct_answers": list(self.correct_answers),
+            "options": list(self.options),
+            "correct_answers": sorted(self.correct_answers),
             "source": self.source
         }
 
@@ -50,7 +66,7 @@ class Question:
         return cls(
             text=data["text"],
             options=data["options"],
-            correct_answers=set(data["correct_answers"]),
+            correct_answers=data["correct_answers"],
             source=data.get("source", "")
         )
 
@@ -67,15 +83,15 @@ def parse_question(ai_text: str, source_url: str) -> Question:
         Question: The parsed Question object.
     """
     # Extract the question text
-    question_match = re.search(r"Question:\s*(.+)", ai_text, re.DOTALL)
+    question_match = _QUESTION_RE.search(ai_text)
     question_text = question_match.group(1).strip() if question_match else "No question found"
 
     # Extract all options (e.g., "1) Option text")
-    option_matches = re.findall(r"\d\)\s*(.+)", ai_text)
+    option_matches = _OPTION_RE.findall(ai_text)
     options = [opt.strip() for opt in option_matches]
 
     # Extract correct answer numbers (e.g., "Correct answers: 1 3")
-    correct_match = re.search(r"(Correct answers|Answer keys|At the end):?\s*([\d\s]+)", ai_text)
+    correct_match = _CORRECT_RE.search(ai_text)
     correct_numbers = correct_match.group(2).split() if correct_match else []
 
     # Convert answer numbers to letters (e.g., 1 -> 'a')
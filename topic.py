@@ -1,8 +1,65 @@
 import os
 import json
 import random
+import hashlib
+import itertools
+import tempfile
+import threading
 from question import Question
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+# Directory containing this module, computed once at import
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to the standard library
+    orjson = None
+
+
+def json_loads(data: bytes):
+    """
+    Parse JSON from bytes, using orjson if it is installed.
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes indented by 2 spaces, using orjson if it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def write_atomic(path: str, data: bytes):
+    """
+    Write data to path via a temporary file in the same directory and os.replace,
+    so the file is never left truncated or half-written.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp creates owner-only files; keep the permissions of the file being replaced
+        try:
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+        except FileNotFoundError:
+            os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
 
 class Topic:
     """
@@ -18,73 +75,128 @@ class Topic:
         sources (List[Source]): List of sources associated with the topic.
 
     Methods:
-        __init__(name: str):
-            Initializes a Topic instance, creates necessary directories, and loads sources and questions.
+        __init__(name: str, sources_file: Optional[str] = None):
+            Initializes a Topic instance and creates necessary directories. Sources and questions are loaded on first access.
         load_sources():
             Loads the list of sources for the topic from the sources JSON file. If the file does not exist, initializes an empty list.
+        save_sources():
+            Saves the current list of sources to the sources JSON file.
         load_questions():
             Loads the list of old questions for the topic from the questions JSON file. If the file does not exist, initializes an empty list.
         save_questions():
-            Saves the current list of old questions to the questions JSON file.
+            Saves the current list of old questions to the questions JSON file, skipping unchanged content.
         add_question(question: Question):
             Adds a new question to the topic and saves the updated list to the file.
+        add_questions(questions: List[Question]):
+            Adds several questions to the topic and saves the updated list to the file once.
+        replace_questions(used: List[Question], new: List[Question]):
+            Removes the used questions, adds the new ones and saves the updated list to the file once.
         get_random_source(use_priorities: bool = False):
             Returns a random source from the topic's sources. If use_priorities is True, selects based on source priority; otherwise, selects randomly.
     """
-    DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "topics_data")
-    SOURCES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "topics_sources")
+    DATA_DIR = os.path.join(_MODULE_DIR, "topics_data")
+    SOURCES_DIR = os.path.join(_MODULE_DIR, "topics_sources")
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, sources_file: Optional[str] = None):
         """
         Initialize a Topic instance.
 
         Args:
             name (str): The name of the topic.
+            sources_file (Optional[str]): Path of the topic's sources JSON file, if already known.
+                Defaults to the topic's file in SOURCES_DIR.
         """
         self.name = name
-        self.old_questions: List["Question"] = []
         self.file_path = os.path.join(self.DATA_DIR, f"{self.name.lower()}.json")
-        self.sources_file = os.path.join(self.SOURCES_DIR, f"{self.name.lower()}.json")
-        self.sources: List[Source] = []
+        self.sources_file = sources_file or os.path.join(self.SOURCES_DIR, f"{self.name.lower()}.json")
+        # Loaded from disk on first access, see the sources and old_questions properties
+        self._sources: Optional[list] = None
+        self._old_questions: Optional[List[Question]] = None
+        # (sources list, cumulative priorities) for get_random_source, rebuilt after sources change
+        self._cum_weights: Optional[Tuple[list, List[int]]] = None
+        # Digest of the last questions content written, to skip unchanged rewrites
+        self._last_save_hash: Optional[str] = None
+        # Guards old_questions changes and saves, which also run on worker threads
+        self._questions_lock = threading.RLock()
 
         # Ensure data directories exist
         os.makedirs(self.DATA_DIR, exist_ok=True)
         os.makedirs(self.SOURCES_DIR, exist_ok=True)
 
-        self.load_sources()
-        self.load_questions()
+    @property
+    def sources(self) -> list:
+        """
+        The topic's sources, loaded from the sources JSON file on first access.
+        """
+        if self._sources is None:
+            self.load_sources()
+        return self._sources
+
+    @sources.setter
+    def sources(self, value: list):
+        self._sources = value
+        self._cum_weights = None
+
+    @property
+    def old_questions(self) -> List[Question]:
+        """
+        The topic's stored questions, loaded from the questions JSON file on first access.
+        """
+        if self._old_questions is None:
+            with self._questions_lock:
+                if self._old_questions is None:
+                    self.load_questions()
+        return self._old_questions
+
+    @old_questions.setter
+    def old_questions(self, value: List[Question]):
+        self._old_questions = value
 
     def load_sources(self):
         """
         Load the list of sources for the topic from the sources JSON file.
         If the file does not exist, initializes an empty list.
         """
-        filepath = os.path.join(os.path.dirname(__file__), "topics_sources", f"{self.name.lower()}.json")
-        if os.path.isfile(filepath):
-            with open(filepath, "r", encoding="utf-8") as f:
+        try:
+            with open(self.sources_file, "rb") as f:
                 # Load sources as list of dicts
-                self.sources = json.load(f)
-        else:
+                self.sources = json_loads(f.read())
+        except FileNotFoundError:
             self.sources = []
 
+    def save_sources(self):
+        """
+        Save the current list of sources to the sources JSON file.
+        """
+        # Sources may have been edited in place before saving
+        self._cum_weights = None
+        write_atomic(self.sources_file, json_dumps(self.sources))
+
     def load_questions(self):
         """
         Load the list of old questions for the topic from the questions JSON file.
         If the file does not exist, initializes an empty list.
         """
-        if not os.path.isfile(self.file_path):
+        try:
+            with open(self.file_path, "rb") as f:
+                data = json_loads(f.read())
+        except (FileNotFoundError, json.JSONDecodeError):
             self.old_questions = []
             return
-        with open(self.file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            self.old_questions = [Question.from_dict(q) for q in data]
+        self.old_questions = [Question.from_dict(q) for q in data]
 
     def save_questions(self):
         """
         Save the current list of old questions to the questions JSON file.
+        Skips the write if the content is unchanged since the last save.
         """
-        with open(self.file_path, "w", encoding="utf-8") as f:
-            json.dump([q.to_dict() for q in self.old_questions], f, indent=2)
+        with self._questions_lock:
+            data = json_dumps([q.to_dict() for q in self.old_questions])
+            digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+            if digest == self._last_save_hash:
+                return
+            write_atomic(self.file_path, data)
+            self._last_save_hash = digest
 
     def add_question(self, question: Question):
         """
@@ -93,8 +205,33 @@ class Topic:
         Args:
             question (Question): The question to add.
         """
-        self.old_questions.append(question)
-        self.save_questions()
+        with self._questions_lock:
+            self.old_questions.append(question)
+            self.save_questions()
+
+    def add_questions(self, questions: List[Question]):
+        """
+        Add several questions to the topic and save the updated list to the file once.
+
+        Args:
+            questions (List[Question]): The questions to add.
+        """
+        with self._questions_lock:
+            self.old_questions.extend(questions)
+            self.save_questions()
+
+    def replace_questions(self, used: List[Question], new: List[Question]):
+        """
+        Remove the used questions from the topic, add the new ones and save the updated list to the file once.
+
+        Args:
+            used (List[Question]): Stored questions to remove.
+            new (List[Question]): The questions to add.
+        """
+        with self._questions_lock:
+            used_ids = {id(q) for q in used}
+            self.old_questions = [q for q in self.old_questions if id(q) not in used_ids] + new
+            self.save_questions()
 
     def get_random_source(self, use_priorities: bool = False):
         """
@@ -106,21 +243,28 @@ class Topic:
         Returns:
             Source or None: The selected source, or None if no sources exist.
         """
-        if not self.sources:
+        # Sources may be reloaded from another thread; work on one consistent list
+        sources = self.sources
+        if not sources:
             return None
 
         if not use_priorities:
             # Randomly select a source (old behavior)
-            source_dict = random.choice(self.sources)
+            source_dict = random.choice(sources)
             return Source.from_dict(source_dict)
 
         # Priority-based selection
         # Priority can be 0–10; if all are 0, fall back to random
-        weights = [max(0, s.get("priority", 0)) for s in self.sources]
-        if sum(weights) == 0:
-            source_dict = random.choice(self.sources)
+        cached = self._cum_weights
+        if cached is not None and cached[0] is sources and len(cached[1]) == len(sources):
+            cum_weights = cached[1]
+        else:
+            cum_weights = list(itertools.accumulate(max(0, s.get("priority", 0)) for s in sources))
+            self._cum_weights = (sources, cum_weights)
+        if cum_weights[-1] == 0:
+            source_dict = random.choice(sources)
         else:
-            source_dict = random.choices(self.sources, weights=weights, k=1)[0]
+            source_dict = random.choices(sources, cum_weights=cum_weights, k=1)[0]
 
         return Source.from_dict(source_dict)
 